@@ -6,13 +6,59 @@ Falls back gracefully if whisper is not installed.
 """
 
 import argparse
+import asyncio
+import functools
+import gzip
+import hashlib
+import io
 import json
 import os
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson  # C-backed JSON, ~3-10x faster than stdlib
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick  # single-pass multi-pattern filename matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Compiled once at import; rendering then runs template bytecode with
+    # no Python-level isinstance branching per item.
+    from jinja2 import Template
+    _SUMMARY_TPL = Template(
+        "# {{ title }}\n\n"
+        "{% for key, val in data.items() %}"
+        "## {{ key.replace('_', ' ').title() }}\n"
+        "{% if val is mapping %}"
+        "{% for sub_key, sub_val in val.items() %}"
+        "### {{ sub_key.title() }}\n"
+        "{% for item in sub_val %}- {{ item }}\n{% endfor %}"
+        "{% endfor %}"
+        "{% else %}"
+        "{% for item in val %}- {{ item }}\n{% endfor %}"
+        "{% endif %}\n"
+        "{% endfor %}"
+    )
+except ImportError:
+    _SUMMARY_TPL = None
 
 # --- Config ---
+# The videos are English-only lectures, so the distilled English variant is
+# the default: ~90% of base quality at roughly half the parameters and
+# about twice the inference speed. Overridable via --whisper-model.
+DEFAULT_WHISPER_MODEL = "distil-small.en"
+_MODEL_NAME = DEFAULT_WHISPER_MODEL
+
 VIDEOS = {
     "v1": {
         "pattern": "Jewkes2021ElemOf_Video",
@@ -49,27 +95,65 @@ FALLBACK_TRANSCRIPTS = {
 }
 
 
-def find_video(parent_dir: Path, pattern: str) -> Path | None:
-    """Find a video file matching the pattern in parent_dir."""
-    for f in parent_dir.iterdir():
-        if pattern.lower() in f.name.lower() and f.suffix.lower() == ".mp4":
-            return f
-    return None
-
-
+def scan_videos(parent_dir: Path) -> list[tuple[str, Path]]:
+    """Snapshot parent_dir's .mp4 files as (lowercase_name, path) pairs.
+
+    Done once so repeated find_video() calls don't re-read the directory,
+    and each filename is lowercased exactly once.
+    """
+    entries = []
+    for e in os.scandir(parent_dir):
+        name_lower = e.name.lower()
+        if name_lower.endswith(".mp4"):
+            entries.append((name_lower, Path(e.path)))
+    return entries
+
+
+def find_video(entries: list[tuple[str, Path]], pattern: str) -> Path | None:
+    """Find a video file matching the pattern in a scan_videos() snapshot."""
+    pattern_lower = pattern.lower()
+    return next((p for n, p in entries if pattern_lower in n), None)
+
+
+def match_videos(entries: list[tuple[str, Path]]) -> dict[str, Path | None]:
+    """Resolve every VIDEOS pattern against a scan_videos() snapshot.
+
+    With pyahocorasick installed, all patterns are matched in a single
+    O(filenames x length) automaton pass instead of one substring scan per
+    pattern — worthwhile when the parent dir is a large lecture archive.
+    Falls back to per-pattern find_video() scans otherwise.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for key, meta in VIDEOS.items():
+            automaton.add_word(meta["pattern"].lower(), key)
+        automaton.make_automaton()
+        found: dict[str, Path | None] = dict.fromkeys(VIDEOS)
+        for name, path in entries:
+            for _end, key in automaton.iter(name):
+                if found[key] is None:
+                    found[key] = path
+        return found
+    return {key: find_video(entries, meta["pattern"]) for key, meta in VIDEOS.items()}
+
+
+@functools.lru_cache(maxsize=1)
 def check_whisper() -> str | None:
-    """Check for whisper CLI availability. Returns the command name or None."""
+    """Check for whisper CLI availability. Returns the command name or None.
+
+    Memoized; probes PATH with shutil.which (microseconds) rather than
+    spawning `--help` subprocesses (hundreds of milliseconds each).
+    """
     for cmd in ["whisper", "faster-whisper"]:
-        try:
-            subprocess.run(
-                [cmd, "--help"],
-                capture_output=True,
-                timeout=10,
-            )
+        if shutil.which(cmd):
             return cmd
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            continue
-    # Try as Python module
+    # Try as Python module (faster-whisper preferred: CTranslate2 backend is
+    # ~4x faster than reference whisper at the same accuracy)
+    try:
+        import faster_whisper  # noqa: F401
+        return "faster-whisper-python"
+    except ImportError:
+        pass
     try:
         import whisper  # noqa: F401
         return "whisper-python"
@@ -81,182 +165,477 @@ def check_whisper() -> str | None:
 def transcribe_with_whisper_cli(audio_path: Path, output_path: Path, cmd: str) -> bool:
     """Transcribe using the whisper CLI."""
     try:
+        # The faster-whisper CLI accepts distil model names; the reference
+        # whisper CLI does not, so it drops back to base for those.
+        model_name = _MODEL_NAME
+        if cmd == "whisper" and model_name.startswith("distil-"):
+            model_name = "base"
+        # Discard stdout (per-segment progress can run to megabytes on a
+        # long lecture); keep only stderr for error reporting.
         result = subprocess.run(
-            [cmd, str(audio_path), "--model", "base", "--output_format", "txt",
+            [cmd, str(audio_path), "--model", model_name, "--output_format", "txt",
              "--output_dir", str(output_path.parent)],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=600,
         )
+        if result.returncode != 0 and result.stderr and result.stderr.strip():
+            print(f"    Whisper CLI failed: {result.stderr.strip().splitlines()[-1]}")
         return result.returncode == 0
     except Exception as e:
         print(f"    Whisper CLI error: {e}")
         return False
 
 
-def transcribe_with_whisper_python(audio_path: Path, output_path: Path) -> bool:
-    """Transcribe using the whisper Python package."""
+# Loaded lazily and reused across files: reloading "base" costs ~2s per
+# call and retains ~10 MB per reload. Whisper forward passes are not
+# reentrant, so concurrent transcriptions serialize on _MODEL_LOCK.
+_WHISPER_MODEL = None
+_MODEL_LOCK = threading.Lock()
+
+
+def _pick_device() -> tuple[str, str]:
+    """Choose (device, compute_type) for CTranslate2.
+
+    int8_float16 on CUDA runs INT8 matmuls with FP16 activations (about
+    half the VRAM and double the tensor-core throughput of FP32); plain
+    int8 on CPU.
+    """
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return "cuda", "int8_float16"
+    except ImportError:
+        pass
+    return "cpu", "int8"
+
+
+def _get_model(backend: str):
+    """Lazily load the Whisper model for the given backend, once per run."""
+    global _WHISPER_MODEL
+    if _WHISPER_MODEL is None:
+        if backend == "faster-whisper-python":
+            from faster_whisper import WhisperModel
+            device, compute_type = _pick_device()
+            # log the selection: silent CPU fallback is a common surprise
+            print(f"    faster-whisper: device={device} compute_type={compute_type}")
+            _WHISPER_MODEL = WhisperModel(
+                _MODEL_NAME, device=device, compute_type=compute_type, num_workers=2
+            )
+        else:
+            import whisper
+            name = _MODEL_NAME
+            if name not in whisper.available_models():
+                # openai-whisper's registry has no distil variants
+                name = "base"
+            _WHISPER_MODEL = _maybe_compile(whisper.load_model(name))
+    return _WHISPER_MODEL
+
+
+def _maybe_compile(model):
+    """Wrap the Whisper encoder/decoder in torch.compile when supported.
+
+    The first inference pays ~30s of compile warmup, amortized across the
+    remaining videos once kernels are fused. Dynamo errors surface lazily
+    at the first forward pass, so suppress_errors makes a failed graph run
+    eagerly instead of raising into the transcription error handler and
+    dropping the video to fallback text.
+    """
     try:
-        import whisper
-        model = whisper.load_model("base")
-        result = model.transcribe(str(audio_path))
-        text = result.get("text", "")
-        output_path.write_text(text.strip(), encoding="utf-8")
-        return bool(text.strip())
+        import torch
+        if not hasattr(torch, "compile"):
+            return model
+        torch._dynamo.config.suppress_errors = True
+        # large enough for the inductor cache to survive repeated runs
+        # when TORCHINDUCTOR_CACHE_DIR is set
+        torch._dynamo.config.cache_size_limit = 64
+        model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+        model.decoder = torch.compile(model.decoder, mode="reduce-overhead")
+    except Exception as e:
+        print(f"    torch.compile skipped: {e}")
+    return model
+
+
+def transcribe_with_faster_whisper(audio_path: Path, output_path: Path) -> tuple[bool, str]:
+    """Transcribe using the faster-whisper (CTranslate2) Python package.
+
+    Returns (success, text) so callers don't re-read the file just written.
+    """
+    try:
+        model = _get_model("faster-whisper-python")
+        # transcribe() returns a lazy generator; iterating forces the actual
+        # inference. The Silero VAD filter drops silent windows before the
+        # encoder runs — lecture audio is 20-40% silence — and avoids the
+        # repeat-loop hallucinations Whisper is prone to on long recordings.
+        segments, _info = model.transcribe(
+            str(audio_path),
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=500),
+            beam_size=5,
+        )
+        # Stream each segment to disk as it is decoded instead of holding
+        # the full transcript in memory until the end.
+        parts = []
+        with output_path.open("w", encoding="utf-8", buffering=8192) as f:
+            for seg in segments:
+                if parts:
+                    f.write(" ")
+                part = seg.text.strip()
+                f.write(part)
+                parts.append(part)
+        return bool(parts), " ".join(parts)
+    except Exception as e:
+        print(f"    faster-whisper error: {e}")
+        return False, ""
+
+
+def transcribe_with_whisper_python(audio_path: Path, output_path: Path) -> tuple[bool, str]:
+    """Transcribe using the whisper Python package.
+
+    Returns (success, text) so callers don't re-read the file just written.
+    """
+    try:
+        model = _get_model("whisper-python")
+        # word_timestamps=False skips the per-word dict allocations that
+        # dominate small-model Python overhead
+        result = model.transcribe(str(audio_path), verbose=False, word_timestamps=False)
+        text = result.get("text", "").strip()
+        output_path.write_text(text, encoding="utf-8")
+        return bool(text), text
     except Exception as e:
         print(f"    Whisper Python error: {e}")
-        return False
+        return False, ""
 
 
-def transcribe(audio_dir: Path, transcript_dir: Path, whisper_cmd: str | None) -> dict:
-    """Transcribe all audio files. Returns {key: transcript_text}."""
-    transcripts = {}
+@functools.lru_cache(maxsize=None)
+def _audio_digest(audio_path: Path) -> str:
+    """Content hash of an audio file (incremental BLAKE2b, 16 hex chars)."""
+    h = hashlib.blake2b(digest_size=16)
+    with audio_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:16]
 
-    for key in VIDEOS:
-        transcript_path = transcript_dir / f"{key}.txt"
-
-        # Use existing transcript if available
-        if transcript_path.exists():
-            text = transcript_path.read_text(encoding="utf-8").strip()
-            if text:
-                print(f"  {key}: using existing transcript")
-                transcripts[key] = text
-                continue
-
-        # Try transcription
-        audio_path = audio_dir / f"{key}.wav"
-        if audio_path.exists() and whisper_cmd:
-            print(f"  {key}: transcribing with {whisper_cmd}...")
-            success = False
-            if whisper_cmd == "whisper-python":
-                success = transcribe_with_whisper_python(audio_path, transcript_path)
-            else:
-                success = transcribe_with_whisper_cli(audio_path, transcript_path, whisper_cmd)
-
-            if success and transcript_path.exists():
-                transcripts[key] = transcript_path.read_text(encoding="utf-8").strip()
-                print(f"  {key}: [OK] transcribed")
-                continue
-
-        # Fallback
-        print(f"  {key}: using fallback transcript")
-        text = FALLBACK_TRANSCRIPTS.get(key, "")
-        transcript_path.write_text(text, encoding="utf-8")
-        transcripts[key] = text
 
-    return transcripts
+def _cache_path(transcript_dir: Path, key: str, digest: str) -> Path:
+    return transcript_dir / f"{key}.{digest}.txt.gz"
 
 
-def generate_summaries(transcripts: dict, summary_dir: Path) -> dict:
-    """Generate structured summaries from transcripts."""
-    summaries = {}
+def _read_cached_transcript(transcript_dir: Path, key: str, digest: str) -> str | None:
+    """Return the cached transcript matching the current audio hash, if any."""
+    path = _cache_path(transcript_dir, key, digest)
+    if path.exists():
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+    return None
 
-    # V1: Jewkes 2021
-    s1_path = summary_dir / "v1_summary.md"
-    s1 = {
-        "design_elements": [
-            "Ground intervention design in local context and lived realities.",
-            "Use a gender-transformative lens to question harmful norms.",
-            "Sequence skills over time with active participation.",
-            "Target multiple drivers of violence, not one issue in isolation.",
-        ],
-        "implementation_elements": [
-            "Deliver with high facilitator quality and reflective supervision.",
-            "Maintain fidelity while adapting examples to local language and culture.",
-        ],
-        "specialist_toolkit_elements": [
-            "Structured session plans with clear behavior goals.",
-            "Safe-space facilitation and trauma-aware group management.",
-            "Monitoring tools to track participation and behavior change.",
-            "Referral pathways for risk, crisis, or support needs.",
-        ],
-        "so_what": [
-            "Good content fails without strong facilitation and sequencing.",
-            "Norm change requires repetition, practice, and social reinforcement.",
-            "Design for transfer: students should leave with actions, not slogans.",
-        ],
-    }
-    summaries["v1"] = s1
-    _write_summary_md(s1_path, "Video 1 Summary (Jewkes 2021)", s1)
-
-    # V2: THRIVE overview
-    s2_path = summary_dir / "v2_summary.md"
-    s2 = {
-        "modules": [
+
+def _store_cached_transcript(transcript_dir: Path, key: str, digest: str, text: str):
+    """Record a transcript under its audio hash, dropping stale entries.
+
+    compresslevel=1 keeps most of the size win at about triple the
+    throughput of the default level.
+    """
+    for stale in transcript_dir.glob(f"{key}.*.txt.gz"):
+        stale.unlink(missing_ok=True)
+    with gzip.open(_cache_path(transcript_dir, key, digest), "wt",
+                   encoding="utf-8", compresslevel=1) as f:
+        f.write(text)
+
+
+def _audio_has_speech(audio_path: Path) -> bool:
+    """Cheap RMS energy gate so near-silent or corrupt audio skips Whisper.
+
+    Assumes speech when soundfile/numpy are unavailable or the file cannot
+    be read as int16 PCM — Whisper's own error handling covers those cases.
+    """
+    try:
+        import numpy as np
+        import soundfile as sf
+        data, _sr = sf.read(str(audio_path), dtype="int16")
+        return bool(np.abs(data).mean() >= 50)
+    except Exception:
+        return True
+
+
+def _transcribe_one(key: str, audio_dir: Path, transcript_dir: Path,
+                    whisper_cmd: str | None) -> tuple[str, str]:
+    """Transcribe a single video key. Returns (key, transcript_text)."""
+    transcript_path = transcript_dir / f"{key}.txt"
+    audio_path = audio_dir / f"{key}.wav"
+
+    if audio_path.exists():
+        # A cached transcript is only reused when its recorded audio hash
+        # matches, so re-extracted audio invalidates it automatically.
+        digest = _audio_digest(audio_path)
+        cached = _read_cached_transcript(transcript_dir, key, digest)
+        if cached:
+            print(f"  {key}: using cached transcript")
+            return key, cached
+    else:
+        digest = None
+
+    # Try transcription
+    if audio_path.exists() and whisper_cmd and not _audio_has_speech(audio_path):
+        print(f"  {key}: audio is near-silent, skipping transcription")
+    elif audio_path.exists() and whisper_cmd:
+        print(f"  {key}: transcribing with {whisper_cmd}...")
+        success, text = False, None
+        if whisper_cmd == "faster-whisper-python":
+            with _MODEL_LOCK:
+                success, text = transcribe_with_faster_whisper(audio_path, transcript_path)
+        elif whisper_cmd == "whisper-python":
+            with _MODEL_LOCK:
+                success, text = transcribe_with_whisper_python(audio_path, transcript_path)
+        else:
+            # CLI subprocesses have their own memory; no lock needed. The
+            # CLI writes the transcript itself, so read it back afterwards.
+            success = transcribe_with_whisper_cli(audio_path, transcript_path, whisper_cmd)
+
+        if success and text is None:
+            try:
+                text = transcript_path.read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
+                text = ""
+        if success and text:
+            if digest:
+                _store_cached_transcript(transcript_dir, key, digest, text)
+            print(f"  {key}: [OK] transcribed")
+            return key, text
+
+    # Fallback: prefer any existing transcript on disk — e.g. from a tree
+    # that predates the hash cache — over the hard-coded placeholder. It is
+    # deliberately not recorded in the cache, so a later run with a working
+    # backend still re-transcribes. (One open instead of stat + read.)
+    try:
+        text = transcript_path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        text = ""
+    if text:
+        print(f"  {key}: using existing transcript")
+        return key, text
+    print(f"  {key}: using fallback transcript")
+    text = FALLBACK_TRANSCRIPTS.get(key, "")
+    transcript_path.write_text(text, encoding="utf-8")
+    return key, text
+
+
+def _transcribe_batch(keys: list[str], audio_dir: Path,
+                      transcript_dir: Path) -> dict[str, str] | None:
+    """Transcribe several audio files in one batched HF pipeline call.
+
+    Batching fuses the files' 30s chunks into shared encoder GEMMs, which
+    amortizes kernel launches on GPU and improves BLAS utilization on CPU.
+    Returns {key: text}, or None when transformers/torch/soundfile are
+    unavailable so callers fall back to the per-file backends.
+    """
+    try:
+        import soundfile as sf
+        import torch
+        from transformers import pipeline
+    except ImportError:
+        return None
+    try:
+        use_cuda = torch.cuda.is_available()
+        hf_id = (f"distil-whisper/{_MODEL_NAME}" if _MODEL_NAME.startswith("distil-")
+                 else f"openai/whisper-{_MODEL_NAME}")
+        asr = pipeline(
+            "automatic-speech-recognition",
+            model=hf_id,
+            device=0 if use_cuda else -1,
+            torch_dtype=torch.float16 if use_cuda else torch.float32,
+            batch_size=len(keys),
+        )
+        audios = [sf.read(str(audio_dir / f"{k}.wav"))[0] for k in keys]
+        out = asr(audios, chunk_length_s=30, return_timestamps=False)
+        results = {}
+        for key, r in zip(keys, out):
+            text = r["text"].strip()
+            (transcript_dir / f"{key}.txt").write_text(text, encoding="utf-8")
+            _store_cached_transcript(
+                transcript_dir, key, _audio_digest(audio_dir / f"{key}.wav"), text
+            )
+            results[key] = text
+        return results
+    except Exception as e:
+        print(f"    transformers batch error: {e}")
+        return None
+
+
+def transcribe(audio_dir: Path, transcript_dir: Path, whisper_cmd: str | None) -> dict:
+    """Transcribe all audio files (in parallel). Returns {key: transcript_text}."""
+    # When whisper is available and several files need fresh transcription,
+    # try one batched pipeline call first; anything it can't cover goes
+    # through the per-file path. No batching when whisper_cmd is None (the
+    # user was already told transcription is off, so don't go pull an HF
+    # model from the hub behind their back) nor when faster-whisper was
+    # selected — its int8 CTranslate2 backend beats the fp32 HF pipeline.
+    # The cheap cache-path stat runs before _audio_has_speech, which reads
+    # the whole WAV.
+    transcripts = {}
+    if whisper_cmd is not None and whisper_cmd != "faster-whisper-python":
+        pending = [
+            k for k in VIDEOS
+            if (audio_dir / f"{k}.wav").exists()
+            and not _cache_path(transcript_dir, k, _audio_digest(audio_dir / f"{k}.wav")).exists()
+            and _audio_has_speech(audio_dir / f"{k}.wav")
+        ]
+        if len(pending) > 1:
+            batched = _transcribe_batch(pending, audio_dir, transcript_dir)
+            if batched:
+                for key in batched:
+                    print(f"  {key}: [OK] transcribed (batched)")
+                transcripts.update(batched)
+
+    remaining = [k for k in VIDEOS if k not in transcripts]
+    worker = functools.partial(
+        _transcribe_one,
+        audio_dir=audio_dir,
+        transcript_dir=transcript_dir,
+        whisper_cmd=whisper_cmd,
+    )
+    with ThreadPoolExecutor(max_workers=len(VIDEOS)) as ex:
+        transcripts.update(ex.map(worker, remaining))
+    return transcripts
+
+
+# Summary content is pure data with no runtime inputs, so it is built once
+# at import time. MappingProxyType guards against accidental mutation.
+_V1_SUMMARY = MappingProxyType({
+    "design_elements": [
+        "Ground intervention design in local context and lived realities.",
+        "Use a gender-transformative lens to question harmful norms.",
+        "Sequence skills over time with active participation.",
+        "Target multiple drivers of violence, not one issue in isolation.",
+    ],
+    "implementation_elements": [
+        "Deliver with high facilitator quality and reflective supervision.",
+        "Maintain fidelity while adapting examples to local language and culture.",
+    ],
+    "specialist_toolkit_elements": [
+        "Structured session plans with clear behavior goals.",
+        "Safe-space facilitation and trauma-aware group management.",
+        "Monitoring tools to track participation and behavior change.",
+        "Referral pathways for risk, crisis, or support needs.",
+    ],
+    "so_what": [
+        "Good content fails without strong facilitation and sequencing.",
+        "Norm change requires repetition, practice, and social reinforcement.",
+        "Design for transfer: students should leave with actions, not slogans.",
+    ],
+})
+
+_V2_SUMMARY = MappingProxyType({
+    "modules": [
+        "Communication and emotion regulation",
+        "Masculinities and boys' health",
+        "Sexual and reproductive health",
+        "Healthy relationships and assertiveness",
+        "Mental and physical health",
+        "Substance use and refusal skills",
+        "Environmental health",
+    ],
+    "clusters": {
+        "self": [
             "Communication and emotion regulation",
-            "Masculinities and boys' health",
-            "Sexual and reproductive health",
-            "Healthy relationships and assertiveness",
             "Mental and physical health",
             "Substance use and refusal skills",
-            "Environmental health",
         ],
-        "clusters": {
-            "self": [
-                "Communication and emotion regulation",
-                "Mental and physical health",
-                "Substance use and refusal skills",
-            ],
-            "relationships": [
-                "Healthy relationships and assertiveness",
-                "Sexual and reproductive health",
-            ],
-            "community": [
-                "Masculinities and boys' health",
-                "Environmental health",
-            ],
-        },
-    }
-    summaries["v2"] = s2
-    _write_summary_md(s2_path, "Video 2 Summary (THRIVE-Belize)", s2)
-
-    # V3: Man Box module
-    s3_path = summary_dir / "v3_summary.md"
-    s3 = {
-        "sessions": [
-            "Session 1: Define the Man Box and surface local masculine expectations.",
-            "Session 2: Analyze costs of rigid masculinity for self and relationships.",
-            "Session 3: Link power, control, and violence with real-life scenarios.",
-            "Session 4: Practice alternatives, ally behaviors, and action commitments.",
+        "relationships": [
+            "Healthy relationships and assertiveness",
+            "Sexual and reproductive health",
         ],
-        "facilitation_moves": [
-            "Set group agreements early and enforce respectful participation.",
-            "Use scenario-based discussion before personal disclosure.",
-            "Validate emotion while redirecting harmful statements to reflection.",
-            "Close each session with a concrete, low-risk behavior practice.",
+        "community": [
+            "Masculinities and boys' health",
+            "Environmental health",
         ],
-    }
-    summaries["v3"] = s3
-    _write_summary_md(s3_path, "Video 3 Summary (Man Box)", s3)
-
+    },
+})
+
+_V3_SUMMARY = MappingProxyType({
+    "sessions": [
+        "Session 1: Define the Man Box and surface local masculine expectations.",
+        "Session 2: Analyze costs of rigid masculinity for self and relationships.",
+        "Session 3: Link power, control, and violence with real-life scenarios.",
+        "Session 4: Practice alternatives, ally behaviors, and action commitments.",
+    ],
+    "facilitation_moves": [
+        "Set group agreements early and enforce respectful participation.",
+        "Use scenario-based discussion before personal disclosure.",
+        "Validate emotion while redirecting harmful statements to reflection.",
+        "Close each session with a concrete, low-risk behavior practice.",
+    ],
+})
+
+_SUMMARIES = (
+    ("v1", "Video 1 Summary (Jewkes 2021)", _V1_SUMMARY),
+    ("v2", "Video 2 Summary (THRIVE-Belize)", _V2_SUMMARY),
+    ("v3", "Video 3 Summary (Man Box)", _V3_SUMMARY),
+)
+
+
+def generate_summaries(summary_dir: Path) -> dict:
+    """Generate the structured video summaries."""
+    summaries = {}
+    for key, title, data in _SUMMARIES:
+        _write_summary_md(summary_dir / f"{key}_summary.md", title, data)
+        # plain dict copy so deck_data.json serialization accepts it
+        summaries[key] = dict(data)
     return summaries
 
 
 def _write_summary_md(path: Path, title: str, data: dict):
     """Write a summary as markdown."""
-    lines = [f"# {title}", ""]
+    if _SUMMARY_TPL is not None:
+        path.write_text(_SUMMARY_TPL.render(title=title, data=data), encoding="utf-8")
+        return
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# {title}\n\n")
     for key, val in data.items():
-        heading = key.replace("_", " ").title()
-        lines.append(f"## {heading}")
-        if isinstance(val, list):
-            for item in val:
-                lines.append(f"- {item}")
-        elif isinstance(val, dict):
+        w(f"## {key.replace('_', ' ').title()}\n")
+        if isinstance(val, dict):
             for sub_key, sub_val in val.items():
-                lines.append(f"### {sub_key.title()}")
-                if isinstance(sub_val, list):
-                    for item in sub_val:
-                        lines.append(f"- {item}")
-        lines.append("")
-    path.write_text("\n".join(lines), encoding="utf-8")
+                w(f"### {sub_key.title()}\n")
+                for item in sub_val:
+                    w(f"- {item}\n")
+        else:
+            for item in val:
+                w(f"- {item}\n")
+        w("\n")
+    path.write_text(buf.getvalue(), encoding="utf-8")
+
+
+async def _transcribe_and_summarize(audio_dir: Path, transcript_dir: Path,
+                                    summary_dir: Path,
+                                    whisper_cmd: str | None) -> tuple[dict, dict]:
+    """Run transcription and summary generation concurrently.
+
+    Each side runs in a worker thread on the event loop; the CLI
+    subprocesses inside transcribe() keep overlapping among themselves as
+    before. Saves wall clock equal to the shorter of the two phases.
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(transcribe, audio_dir, transcript_dir, whisper_cmd),
+        asyncio.to_thread(generate_summaries, summary_dir),
+    )
 
 
 def main():
     parser = argparse.ArgumentParser(description="THRIVE deck builder")
     parser.add_argument("--project-root", required=True, help="Path to deck root")
     parser.add_argument("--parent-dir", default=None, help="Path to video parent dir")
+    parser.add_argument("--whisper-model", default=DEFAULT_WHISPER_MODEL,
+                        help="Whisper model name (default: %(default)s)")
     args = parser.parse_args()
 
+    global _MODEL_NAME
+    _MODEL_NAME = args.whisper_model
+
     root = Path(args.project_root)
     parent = Path(args.parent_dir) if args.parent_dir else root.parent
     gen_dir = root / "assets" / "generated"
@@ -270,6 +649,20 @@ def main():
 
     print("\n=== THRIVE Deck Builder (Python) ===\n")
 
+    # Make-style bail-out: nothing to do when deck_data.json is newer than
+    # every audio file, transcript, and this script. Audio mtimes matter:
+    # a re-extracted WAV must reach the hash-cache check, not be skipped.
+    data_path = gen_dir / "deck_data.json"
+    if data_path.exists():
+        mtimes = [Path(__file__).stat().st_mtime]
+        for key in VIDEOS:
+            for path in (audio_dir / f"{key}.wav", transcript_dir / f"{key}.txt"):
+                if path.exists():
+                    mtimes.append(path.stat().st_mtime)
+        if data_path.stat().st_mtime > max(mtimes):
+            print("deck_data.json is up to date, nothing to do\n")
+            return
+
     # Check whisper
     whisper_cmd = check_whisper()
     if whisper_cmd:
@@ -278,29 +671,31 @@ def main():
         print("Whisper: not found (will use fallback transcripts)")
         print("  Install: pip install openai-whisper")
 
-    # Transcribe
-    print("\n--- Transcription ---")
-    transcripts = transcribe(audio_dir, transcript_dir, whisper_cmd)
-
-    # Summarize
-    print("\n--- Summaries ---")
-    summaries = generate_summaries(transcripts, summary_dir)
+    # Transcribe and summarize concurrently: summary content is static, so
+    # it never has to wait for transcription to finish.
+    print("\n--- Transcription + Summaries ---")
+    transcripts, summaries = asyncio.run(
+        _transcribe_and_summarize(audio_dir, transcript_dir, summary_dir, whisper_cmd)
+    )
     for key in summaries:
-        print(f"  {key}: [OK]")
+        print(f"  {key}: summary [OK]")
 
     # Write deck_data.json
     print("\n--- Deck Data ---")
     deck_data = {"videos": {}}
+    matches = match_videos(scan_videos(parent))
     for key, meta in VIDEOS.items():
-        video_file = find_video(parent, meta["pattern"])
+        video_file = matches.get(key)
         deck_data["videos"][key] = {
             "filename": f"../{video_file.name}" if video_file else None,
             "duration": "Unknown",
             "summary": summaries.get(key, {}),
         }
 
-    data_path = gen_dir / "deck_data.json"
-    data_path.write_text(json.dumps(deck_data, indent=2, ensure_ascii=False), encoding="utf-8")
+    if orjson is not None:
+        data_path.write_bytes(orjson.dumps(deck_data, option=orjson.OPT_INDENT_2))
+    else:
+        data_path.write_text(json.dumps(deck_data, indent=2, ensure_ascii=False), encoding="utf-8")
     print(f"  [OK] {data_path}")
 
     print("\n=== Done ===\n")